@@ -6,6 +6,7 @@ from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identi
 from app import db
 from models.user import User
 from models.organisation import Organisation
+from api.repository import get_user_by_email
 
 auth_bp = Blueprint('auth', __name__)
 
@@ -61,7 +62,7 @@ def register():
 def login():
     """POST /login"""
     data = request.get_json()
-    user = User.query.filter_by(email=data['email']).first()
+    user = get_user_by_email(data['email'])
     if not user or not check_password_hash(user.password, data['password']):
         return jsonify({"status": "Bad request", "message": "Authentication failed"}), 401
 
@@ -89,7 +90,7 @@ def validate_user_data(data):
     for field in required_fields:
         if field not in data or not data[field]:
             errors.append({"field": field, "message": f"{field} is required"})
-    if 'email' in data and User.query.filter_by(email=data['email']).first():
+    if 'email' in data and get_user_by_email(data['email']):
         errors.append(
             {"field": "email", "message": "Email is already registered"})
     return errors
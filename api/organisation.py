@@ -3,8 +3,8 @@
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from app import db
-from models.user import User
 from models.organisation import Organisation
+from api import repository
 
 organisation_bp = Blueprint('organisation', __name__)
 
@@ -14,7 +14,7 @@ organisation_bp = Blueprint('organisation', __name__)
 def get_user(id):
     """GET /users/<string:id>"""
     current_user = get_jwt_identity()
-    user = User.query.filter_by(userId=id).first()
+    user = repository.get_user(id)
     if not user:
         return jsonify({"status": "Not found", "message": "User not found"}), 404
 
@@ -33,8 +33,7 @@ def get_user(id):
 def get_organisations():
     """GET /organisations"""
     current_user = get_jwt_identity()
-    user = User.query.filter_by(userId=current_user).first()
-    organisations = [org for org in user.organisations]
+    organisations = repository.get_user_organisations(current_user)
     orgs_data = [{"orgId": org.orgId, "name": org.name,
                   "description": org.description} for org in organisations]
     return jsonify({"status": "success", "message": "Organisations retrieved", "data": {"organisations": orgs_data}}), 200
@@ -45,8 +44,8 @@ def get_organisations():
 def get_organisation(orgId):
     """GET /organisations/<string:orgId>"""
     current_user = get_jwt_identity()
-    org = Organisation.query.filter_by(orgId=orgId).first()
-    if not org or current_user not in [user.userId for user in org.users]:
+    org = repository.get_organisation(orgId)
+    if not org or not repository.is_member(orgId, current_user):
         return jsonify({"status": "Not found", "message": "Organisation not found"}), 404
 
     org_data = {"orgId": org.orgId, "name": org.name,
@@ -68,8 +67,12 @@ def create_organisation():
         description=data.get('description'),
         created_by=current_user
     )
-    user = User.query.filter_by(userId=current_user).first()
-    user.organisations.append(new_org)
+    user = repository.get_user(current_user)
+    if not user:
+        return jsonify({"status": "Not found", "message": "User not found"}), 404
+
+    # Appending from the new side avoids loading the user's existing organisations.
+    new_org.users.append(user)
     try:
         db.session.add(new_org)
         db.session.commit()
@@ -90,14 +93,14 @@ def add_user_to_organisation(orgId):
     if 'userId' not in data or not data['userId']:
         return jsonify({"status": "Bad Request", "message": "userId is required"}), 400
 
-    org = Organisation.query.filter_by(orgId=orgId).first()
+    org = repository.get_organisation(orgId)
     if not org:
         return jsonify({"status": "Not found", "message": "Organisation not found"}), 404
 
-    user = User.query.filter_by(userId=data['userId']).first()
+    user = repository.get_user(data['userId'])
     if not user:
         return jsonify({"status": "Not found", "message": "User not found"}), 404
 
-    org.users.append(user)
+    repository.add_member(org.orgId, user.userId)
     db.session.commit()
     return jsonify({"status": "success", "message": "User added to organisation successfully"}), 200
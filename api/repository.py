@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""repository."""
+from sqlalchemy import bindparam, exists, insert, select
+from app import db
+from models.user import User
+from models.organisation import Organisation, user_organisations
+
+# Statements are built once at import time; each call only binds values, so
+# SQLAlchemy's compiled cache is hit without rebuilding a Query per request.
+_user_by_email = select(User).where(User.email == bindparam('email'))
+
+_user_organisations = (
+    select(Organisation)
+    .join(user_organisations,
+          user_organisations.c.organisation_id == Organisation.orgId)
+    .where(user_organisations.c.user_id == bindparam('user_id'))
+)
+
+_is_member = select(exists().where(
+    user_organisations.c.organisation_id == bindparam('org_id'),
+    user_organisations.c.user_id == bindparam('user_id'),
+))
+
+_add_member = insert(user_organisations)
+
+
+def get_user(user_id):
+    """User by primary key, served from the identity map when loaded."""
+    return db.session.get(User, user_id)
+
+
+def get_user_by_email(email):
+    """User by email, or None."""
+    return db.session.scalars(_user_by_email, {'email': email}).first()
+
+
+def get_organisation(org_id):
+    """Organisation by primary key, served from the identity map when loaded."""
+    return db.session.get(Organisation, org_id)
+
+
+def get_user_organisations(user_id):
+    """Organisations `user_id` belongs to, without loading the user."""
+    return db.session.scalars(_user_organisations, {'user_id': user_id}).all()
+
+
+def is_member(org_id, user_id):
+    """Whether `user_id` belongs to `org_id`, without loading its members."""
+    return db.session.scalar(_is_member, {'org_id': org_id, 'user_id': user_id})
+
+
+def add_member(org_id, user_id):
+    """Add `user_id` to `org_id` unless already a member."""
+    if not is_member(org_id, user_id):
+        db.session.execute(_add_member, {'organisation_id': org_id, 'user_id': user_id})
@@ -19,11 +19,17 @@ def create_app(config_class='config.Config'):
     migrate.init_app(app, db)
     jwt.init_app(app)
 
+    from slow_query import init_slow_query_log
+    init_slow_query_log(app, db)
+
     from api.auth import auth_bp
+    from api.export import export_bp, export_command
     from api.home import home_bp
     from api.organisation import organisation_bp
     app.register_blueprint(auth_bp, url_prefix='/auth')
     app.register_blueprint(organisation_bp, url_prefix='/api')
+    app.register_blueprint(export_bp, url_prefix='/api/admin')
     app.register_blueprint(home_bp, url_prefix='/')
+    app.cli.add_command(export_command)
 
     return app
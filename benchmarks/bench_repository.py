@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Compare legacy Model.query lookups with api.repository.
+
+Run from the project root:
+
+    python -m benchmarks.bench_repository
+"""
+import timeit
+from app import create_app, db
+from api import repository
+from models import User, Organisation
+
+NUMBER = 2000
+MEMBERS = 50
+
+
+def seed():
+    """One organisation with MEMBERS users; returns (user_id, org_id)."""
+    org = Organisation(name='Bench Organisation')
+    for i in range(MEMBERS):
+        org.users.append(User(firstName='Bench', lastName=str(i),
+                              email=f'bench{i}@example.com', password='x'))
+    db.session.add(org)
+    db.session.commit()
+    return org.users[0].userId, org.orgId
+
+
+def legacy_get_organisation(org_id, user_id):
+    org = Organisation.query.filter_by(orgId=org_id).first()
+    return org and user_id in [user.userId for user in org.users]
+
+
+def repository_get_organisation(org_id, user_id):
+    org = repository.get_organisation(org_id)
+    return org and repository.is_member(org_id, user_id)
+
+
+def main():
+    app = create_app('config.TestConfig')
+    with app.app_context():
+        db.create_all()
+        user_id, org_id = seed()
+        email = 'bench0@example.com'
+
+        cases = [
+            ('user by id',
+             lambda: User.query.filter_by(userId=user_id).first(),
+             lambda: repository.get_user(user_id)),
+            ('user by email',
+             lambda: User.query.filter_by(email=email).first(),
+             lambda: repository.get_user_by_email(email)),
+            ('user organisations',
+             lambda: list(User.query.filter_by(userId=user_id).first().organisations),
+             lambda: repository.get_user_organisations(user_id)),
+            ('organisation + membership',
+             lambda: legacy_get_organisation(org_id, user_id),
+             lambda: repository_get_organisation(org_id, user_id)),
+        ]
+
+        print(f"{'lookup':<28}{'legacy us':>12}{'repository us':>16}{'speedup':>10}")
+        for name, legacy, repo in cases:
+            # One lookup per simulated request, starting from an empty
+            # session as after teardown, so no identity-map hits are counted.
+            timings = []
+            for func in (legacy, repo):
+                def request():
+                    func()
+                    db.session.remove()
+                request()
+                seconds = min(timeit.repeat(request, number=NUMBER, repeat=3))
+                timings.append(seconds / NUMBER * 1e6)
+            print(f"{name:<28}{timings[0]:>12.1f}{timings[1]:>16.1f}"
+                  f"{timings[0] / timings[1]:>9.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Load test a running server.
+
+Registers a throwaway user, then has CONCURRENCY threads request
+GET /api/organisations over keep-alive connections for DURATION seconds:
+
+    python -m benchmarks.load_test --url http://127.0.0.1:8000 -c 64 -d 30
+"""
+import argparse
+import http.client
+import json
+import threading
+import time
+import uuid
+from urllib.parse import urlsplit
+
+
+def register(host, port):
+    """Register a new user and return its access token."""
+    conn = http.client.HTTPConnection(host, port)
+    body = json.dumps({
+        "firstName": "Load",
+        "lastName": "Test",
+        "email": f"load-{uuid.uuid4().hex}@example.com",
+        "password": "password",
+    })
+    conn.request('POST', '/auth/register', body,
+                 {'Content-Type': 'application/json'})
+    response = conn.getresponse()
+    if response.status != 201:
+        raise SystemExit(f"registration failed: {response.status} {response.read()!r}")
+    return json.loads(response.read())['data']['accessToken']
+
+
+def get(conn, headers):
+    """GET /api/organisations and return the status code."""
+    conn.request('GET', '/api/organisations', headers=headers)
+    response = conn.getresponse()
+    response.read()
+    return response.status
+
+
+def worker(host, port, headers, deadline, counts, errors):
+    conn = http.client.HTTPConnection(host, port)
+    ok = failed = 0
+    while time.monotonic() < deadline:
+        try:
+            try:
+                status = get(conn, headers)
+            except (http.client.RemoteDisconnected, ConnectionResetError,
+                    BrokenPipeError):
+                # The server closed an idle keep-alive connection; retry
+                # the idempotent GET once on a new one, as real clients do.
+                conn.close()
+                conn = http.client.HTTPConnection(host, port)
+                status = get(conn, headers)
+        except (OSError, http.client.HTTPException):
+            failed += 1
+            conn.close()
+            conn = http.client.HTTPConnection(host, port)
+            continue
+        if status == 200:
+            ok += 1
+        else:
+            failed += 1
+    counts.append(ok)
+    errors.append(failed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--url', default='http://127.0.0.1:8000')
+    parser.add_argument('-c', '--concurrency', type=int, default=64)
+    parser.add_argument('-d', '--duration', type=float, default=30)
+    args = parser.parse_args()
+
+    url = urlsplit(args.url)
+    headers = {'Authorization': f'Bearer {register(url.hostname, url.port)}'}
+    deadline = time.monotonic() + args.duration
+    counts, errors = [], []
+    threads = [threading.Thread(target=worker, args=(
+        url.hostname, url.port, headers, deadline, counts, errors))
+        for _ in range(args.concurrency)]
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - start
+
+    print(f"Requests/sec: {sum(counts) / elapsed:.1f} "
+          f"({sum(counts)} ok, {sum(errors)} errors in {elapsed:.1f}s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -12,11 +12,26 @@ class Config:
     """Config class."""
     SQLALCHEMY_DATABASE_URI = os.getenv('SQLALCHEMY_DATABASE_URI')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_size': int(os.getenv('DB_POOL_SIZE', '5')),
+        'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', '10')),
+    }
     JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY', 'your_jwt_secret_key')
+    ADMIN_USER_IDS = [
+        uid.strip() for uid in os.getenv('ADMIN_USER_IDS', '').split(',')
+        if uid.strip()]
+    EXPORT_YIELD_PER = int(os.getenv('EXPORT_YIELD_PER', '1000'))
+    SLOW_QUERY_LOG = os.getenv('SLOW_QUERY_LOG', '').lower() in ('1', 'true', 'yes')
+    SLOW_QUERY_THRESHOLD_MS = float(os.getenv('SLOW_QUERY_THRESHOLD_MS', '200'))
+    SLOW_QUERY_EXPLAIN_SAMPLE_RATE = float(
+        os.getenv('SLOW_QUERY_EXPLAIN_SAMPLE_RATE', '0.1'))
+    SLOW_QUERY_EXPLAIN_MAX = int(os.getenv('SLOW_QUERY_EXPLAIN_MAX', '1000'))
     TESTING = False
 
 
 class TestConfig(Config):
     """Test config."""
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    # The in-memory database uses a single static connection.
+    SQLALCHEMY_ENGINE_OPTIONS = {}
     TESTING = True
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Gunicorn production serving profile.
+
+Run with ``gunicorn manage:app`` from the project root; gunicorn picks this
+file up automatically. Every setting can be overridden from the environment.
+"""
+import multiprocessing
+import os
+
+cpu_count = multiprocessing.cpu_count()
+
+# Each request thread holds at most one database connection, so the whole
+# server uses up to workers * threads. Size both to stay within this budget
+# (PostgreSQL allows 100 connections by default).
+db_connections = int(os.getenv('GUNICORN_DB_CONNECTIONS', 80))
+
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:8000')
+workers = int(os.getenv('GUNICORN_WORKERS',
+                        max(1, min(cpu_count, db_connections // 2))))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS',
+                        max(1, min(4, db_connections // workers))))
+
+# Cap each worker's pool at its thread count. config.py reads these when
+# the app is preloaded, which happens after this file is executed.
+os.environ.setdefault('DB_POOL_SIZE', str(threads))
+os.environ.setdefault('DB_MAX_OVERFLOW', '0')
+
+# Import manage:app (and so create_app) once in the master, then fork.
+preload_app = True
+
+# Recycle workers after this many requests (plus jitter so they don't all
+# restart together) to bound memory growth; 0 disables recycling.
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS', 1000))
+max_requests_jitter = int(os.getenv('GUNICORN_MAX_REQUESTS_JITTER', 100))
+graceful_timeout = int(os.getenv('GUNICORN_GRACEFUL_TIMEOUT', 30))
+timeout = int(os.getenv('GUNICORN_TIMEOUT', 30))
+keepalive = int(os.getenv('GUNICORN_KEEPALIVE', 5))
+
+# An empty value or "none" turns the access log off.
+accesslog = os.getenv('GUNICORN_ACCESSLOG', '-')
+if accesslog.lower() in ('', 'none'):
+    accesslog = None
+errorlog = os.getenv('GUNICORN_ERRORLOG', '-')
+
+
+def post_fork(server, worker):
+    """Drop pooled connections inherited from the master.
+
+    ``close=False`` leaves the parent's sockets alone and just gives the
+    worker a fresh pool, so no connection is ever shared across processes.
+    """
+    from app import db
+    from manage import app
+
+    with app.app_context():
+        db.engine.dispose(close=False)
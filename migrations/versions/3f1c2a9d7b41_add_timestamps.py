@@ -0,0 +1,55 @@
+"""Add timestamps
+
+Revision ID: 3f1c2a9d7b41
+Revises: e85628908728
+Create Date: 2026-10-19 09:12:03.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1c2a9d7b41'
+down_revision = 'e85628908728'
+branch_labels = None
+depends_on = None
+
+
+def utcnow():
+    """Server default for naive DateTime columns holding UTC."""
+    if op.get_bind().dialect.name == 'postgresql':
+        return sa.text("TIMEZONE('utc', CURRENT_TIMESTAMP)")
+    return sa.text('(CURRENT_TIMESTAMP)')
+
+
+def upgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('created_at', sa.DateTime(), server_default=utcnow(), nullable=False))
+        batch_op.add_column(sa.Column('updated_at', sa.DateTime(), server_default=utcnow(), nullable=False))
+        batch_op.create_index(batch_op.f('ix_users_updated_at'), ['updated_at'], unique=False)
+
+    with op.batch_alter_table('organisations', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('created_at', sa.DateTime(), server_default=utcnow(), nullable=False))
+        batch_op.add_column(sa.Column('updated_at', sa.DateTime(), server_default=utcnow(), nullable=False))
+        batch_op.create_index(batch_op.f('ix_organisations_updated_at'), ['updated_at'], unique=False)
+
+    with op.batch_alter_table('user_organisations', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('created_at', sa.DateTime(), server_default=utcnow(), nullable=False))
+        batch_op.create_index(batch_op.f('ix_user_organisations_created_at'), ['created_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('user_organisations', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_user_organisations_created_at'))
+        batch_op.drop_column('created_at')
+
+    with op.batch_alter_table('organisations', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_organisations_updated_at'))
+        batch_op.drop_column('updated_at')
+        batch_op.drop_column('created_at')
+
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_users_updated_at'))
+        batch_op.drop_column('updated_at')
+        batch_op.drop_column('created_at')
@@ -2,13 +2,16 @@
 """organisation."""
 import uuid
 from app import db
+from models.utcnow import utcnow
 
 
 user_organisations = db.Table('user_organisations',
                               db.Column('user_id', db.String, db.ForeignKey(
                                   'users.userId'), primary_key=True),
                               db.Column('organisation_id', db.String, db.ForeignKey(
-                                  'organisations.orgId'), primary_key=True)
+                                  'organisations.orgId'), primary_key=True),
+                              db.Column('created_at', db.DateTime, nullable=False,
+                                        server_default=utcnow(), index=True)
                               )
 
 
@@ -21,3 +24,7 @@ class Organisation(db.Model):
     name = db.Column(db.String, nullable=False)
     description = db.Column(db.String)
     created_by = db.Column(db.String, db.ForeignKey('users.userId'))
+    created_at = db.Column(db.DateTime, nullable=False,
+                           server_default=utcnow())
+    updated_at = db.Column(db.DateTime, nullable=False, index=True,
+                           server_default=utcnow(), onupdate=utcnow())
@@ -2,6 +2,7 @@
 """User."""
 import uuid
 from app import db
+from models.utcnow import utcnow
 
 
 class User(db.Model):
@@ -15,5 +16,9 @@ class User(db.Model):
     email = db.Column(db.String, unique=True, nullable=False)
     password = db.Column(db.String, nullable=False)
     phone = db.Column(db.String)
+    created_at = db.Column(db.DateTime, nullable=False,
+                           server_default=utcnow())
+    updated_at = db.Column(db.DateTime, nullable=False, index=True,
+                           server_default=utcnow(), onupdate=utcnow())
     organisations = db.relationship(
         'Organisation', secondary='user_organisations', backref='users')
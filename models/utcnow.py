@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""utcnow."""
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
+from sqlalchemy.types import DateTime
+
+
+class utcnow(FunctionElement):
+    """Current time in UTC, for naive DateTime columns.
+
+    PostgreSQL's now() follows the session TimeZone, so it is converted
+    explicitly; SQLite's CURRENT_TIMESTAMP is already UTC.
+    """
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _default_utcnow(element, compiler, **kw):
+    return 'CURRENT_TIMESTAMP'
+
+
+@compiles(utcnow, 'postgresql')
+def _pg_utcnow(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Slow-query log."""
+import logging
+import random
+import threading
+import time
+import uuid
+from flask import g, has_request_context, request
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+REDACTED = '***'
+
+
+def _redact(parameters):
+    """Return a copy of bound parameters with password values masked."""
+    if isinstance(parameters, dict):
+        return {key: REDACTED if 'password' in str(key).lower() else value
+                for key, value in parameters.items()}
+    return parameters
+
+
+def _bound_parameters(context, parameters):
+    """Bound parameters keyed by name where SQLAlchemy compiled them."""
+    compiled = getattr(context, 'compiled_parameters', None)
+    if compiled:
+        params = [_redact(p) for p in compiled]
+        return params[0] if len(params) == 1 else params
+    if isinstance(parameters, (list, tuple)) and parameters and \
+            not isinstance(parameters[0], dict):
+        # Positional driver-level parameters can't be matched to columns.
+        return REDACTED
+    return _redact(parameters)
+
+
+class SlowQueryLog:
+    """Logs statements slower than a threshold and EXPLAINs a sample of them."""
+
+    def __init__(self, threshold_ms, explain_sample_rate, explain_max):
+        self.threshold = threshold_ms / 1000.0
+        self.explain_sample_rate = explain_sample_rate
+        self.explain_max = explain_max
+        self._seen = set()
+        self._lock = threading.Lock()
+
+    def install(self, engine):
+        """Attach the cursor execution hooks to `engine`."""
+        event.listen(engine, 'before_cursor_execute', self._before)
+        event.listen(engine, 'after_cursor_execute', self._after)
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        # Kept on the execution context, which is discarded with the
+        # statement, so statements that raise leave nothing behind.
+        context._slow_query_start = time.perf_counter()
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - context._slow_query_start
+        if elapsed < self.threshold:
+            return
+
+        endpoint = request_id = None
+        if has_request_context():
+            endpoint = request.endpoint
+            request_id = g.get('request_id')
+        logger.warning(
+            "slow query %.1fms endpoint=%s request_id=%s statement=%s parameters=%s",
+            elapsed * 1000, endpoint, request_id, statement,
+            _bound_parameters(context, parameters))
+
+        if not executemany and self._should_explain(statement):
+            self._explain(conn, statement, parameters)
+
+    def _should_explain(self, statement):
+        """Sample each unique SELECT statement at most once."""
+        if not statement.lstrip().upper().startswith('SELECT'):
+            return False
+        with self._lock:
+            if statement in self._seen or len(self._seen) >= self.explain_max:
+                return False
+            if random.random() >= self.explain_sample_rate:
+                return False
+            self._seen.add(statement)
+        return True
+
+    def _explain(self, conn, statement, parameters):
+        dialect = conn.dialect.name
+        if dialect == 'postgresql':
+            prefix = 'EXPLAIN '
+        elif dialect == 'sqlite':
+            prefix = 'EXPLAIN QUERY PLAN '
+        else:
+            return
+
+        # Use a fresh DBAPI cursor so the EXPLAIN neither re-enters these
+        # hooks nor disturbs the cursor whose results are still pending.
+        dbapi_connection = conn.connection.dbapi_connection
+        # On PostgreSQL a failed statement aborts the whole transaction, so
+        # the EXPLAIN runs inside a savepoint that is rolled back on error.
+        savepoint = dialect == 'postgresql' and \
+            not getattr(dbapi_connection, 'autocommit', False)
+        cursor = dbapi_connection.cursor()
+        try:
+            if savepoint:
+                cursor.execute('SAVEPOINT slow_query_explain')
+            try:
+                cursor.execute(prefix + statement, parameters)
+                plan = '\n'.join(' '.join(str(col) for col in row)
+                                 for row in cursor.fetchall())
+            except Exception:
+                if savepoint:
+                    cursor.execute('ROLLBACK TO SAVEPOINT slow_query_explain')
+                raise
+            finally:
+                if savepoint:
+                    cursor.execute('RELEASE SAVEPOINT slow_query_explain')
+        except Exception:
+            logger.exception("EXPLAIN failed for statement=%s", statement)
+            return
+        finally:
+            cursor.close()
+        logger.warning("query plan statement=%s\n%s", statement, plan)
+
+
+def init_slow_query_log(app, db):
+    """Enable the slow-query log for `app` if SLOW_QUERY_LOG is set."""
+    if not app.config['SLOW_QUERY_LOG']:
+        return
+
+    @app.before_request
+    def assign_request_id():
+        g.request_id = request.headers.get('X-Request-ID') or uuid.uuid4().hex
+
+    @app.after_request
+    def echo_request_id(response):
+        response.headers['X-Request-ID'] = g.request_id
+        return response
+
+    log = SlowQueryLog(app.config['SLOW_QUERY_THRESHOLD_MS'],
+                       app.config['SLOW_QUERY_EXPLAIN_SAMPLE_RATE'],
+                       app.config['SLOW_QUERY_EXPLAIN_MAX'])
+    with app.app_context():
+        log.install(db.engine)
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""test_export."""
+import json
+import unittest
+from datetime import datetime, timedelta
+from flask_testing import TestCase
+from flask_jwt_extended import create_access_token
+from app import create_app, db
+from api.export import parse_since
+from models import User, Organisation
+
+
+class BaseTestCase(TestCase):
+    """Base test case."""
+
+    def create_app(self):
+        """Create app."""
+        app = create_app('config.TestConfig')
+        return app
+
+    def setUp(self):
+        """Set up integration test."""
+        db.create_all()
+        self.user = User(
+            firstName='John',
+            lastName='Doe',
+            email='john@example.com',
+            password='password',
+            phone='1234567890'
+        )
+        self.user.organisations.append(Organisation(
+            name='John\'s Organisation',
+            description='This is John\'s default organisation'
+        ))
+        db.session.add(self.user)
+        db.session.commit()
+
+        self.app.config['ADMIN_USER_IDS'] = [self.user.userId]
+        self.headers = {
+            'Authorization': f'Bearer {create_access_token(identity=self.user.userId)}'
+        }
+
+    def tearDown(self):
+        """Tear down integration test."""
+        db.session.remove()
+        db.drop_all()
+
+
+class TestExport(BaseTestCase):
+    """Test export."""
+
+    def read_ndjson(self, response):
+        """Decode an NDJSON response body."""
+        return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+    def test_export_users(self):
+        """Test export users."""
+        response = self.client.get('/api/admin/export/users', headers=self.headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'application/x-ndjson')
+        rows = self.read_ndjson(response)
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['userId'], self.user.userId)
+        self.assertNotIn('password', rows[0])
+
+    def test_export_memberships(self):
+        """Test export memberships."""
+        response = self.client.get(
+            '/api/admin/export/user_organisations', headers=self.headers)
+        self.assertEqual(response.status_code, 200)
+        rows = self.read_ndjson(response)
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['user_id'], self.user.userId)
+        self.assertEqual(rows[0]['organisation_id'],
+                         self.user.organisations[0].orgId)
+
+    def test_export_since(self):
+        """Test export changed since."""
+        since = (datetime.utcnow() + timedelta(days=1)).isoformat()
+        response = self.client.get(
+            f'/api/admin/export/organisations?since={since}', headers=self.headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.read_ndjson(response), [])
+
+    def test_export_since_cutoff(self):
+        """Test rows before the cutoff are excluded and rows after it included."""
+        db.session.add_all([
+            Organisation(name='Before', updated_at=datetime(2024, 1, 1)),
+            Organisation(name='After', updated_at=datetime(2024, 6, 1)),
+        ])
+        db.session.commit()
+        for since in ('2024-03-01T00:00:00', '2024-03-01T02:00:00%2B02:00',
+                      '2024-03-01T00:00:00Z'):
+            response = self.client.get(
+                f'/api/admin/export/organisations?since={since}', headers=self.headers)
+            self.assertEqual(response.status_code, 200)
+            names = {row['name'] for row in self.read_ndjson(response)}
+            self.assertIn('After', names)
+            self.assertNotIn('Before', names)
+
+    def test_parse_since(self):
+        """Test since values are normalised to naive UTC."""
+        expected = datetime(2024, 7, 1)
+        for value in ('2024-07-01T00:00:00', '2024-07-01T00:00:00Z',
+                      '2024-07-01T02:00:00+02:00'):
+            self.assertEqual(parse_since(value), expected)
+
+    def test_export_invalid_since(self):
+        """Test export invalid since."""
+        response = self.client.get(
+            '/api/admin/export/organisations?since=yesterday', headers=self.headers)
+        self.assertEqual(response.status_code, 400)
+
+    def test_export_unknown_table(self):
+        """Test export unknown table."""
+        response = self.client.get('/api/admin/export/secrets', headers=self.headers)
+        self.assertEqual(response.status_code, 404)
+
+    def test_export_forbidden(self):
+        """Test export forbidden for non-admins."""
+        self.app.config['ADMIN_USER_IDS'] = []
+        response = self.client.get('/api/admin/export/users', headers=self.headers)
+        self.assertEqual(response.status_code, 403)
+        data = response.get_json()
+        self.assertEqual(data['status'], 'Forbidden')
+
+    def test_export_command(self):
+        """Test export CLI command."""
+        result = self.app.test_cli_runner().invoke(args=['export', 'organisations'])
+        self.assertEqual(result.exit_code, 0)
+        rows = [json.loads(line) for line in result.output.splitlines()]
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['created_by'], None)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""test_repository."""
+import unittest
+from flask_testing import TestCase
+from sqlalchemy import event
+from app import create_app, db
+from api import repository
+from models import User, Organisation
+
+
+class BaseTestCase(TestCase):
+    """Base test case."""
+
+    def create_app(self):
+        """Create app."""
+        app = create_app('config.TestConfig')
+        return app
+
+    def setUp(self):
+        """Set up integration test."""
+        db.create_all()
+        self.user = User(
+            firstName='John',
+            lastName='Doe',
+            email='john@example.com',
+            password='password',
+            phone='1234567890'
+        )
+        self.organisation = Organisation(name='John\'s Organisation')
+        self.user.organisations.append(self.organisation)
+        db.session.add(self.user)
+        db.session.commit()
+        self.user_id = self.user.userId
+        self.org_id = self.organisation.orgId
+
+    def tearDown(self):
+        """Tear down integration test."""
+        db.session.remove()
+        db.drop_all()
+
+
+class TestRepository(BaseTestCase):
+    """Test repository."""
+
+    def count_statements(self, func, *args):
+        """Call `func` and return how many statements it executed."""
+        statements = []
+
+        def before(conn, cursor, statement, *rest):
+            statements.append(statement)
+        event.listen(db.engine, 'before_cursor_execute', before)
+        try:
+            func(*args)
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', before)
+        return len(statements)
+
+    def test_get_user_uses_identity_map(self):
+        """Test a loaded user is returned without a query."""
+        user = repository.get_user(self.user_id)
+        self.assertEqual(user.email, 'john@example.com')
+        self.assertEqual(self.count_statements(repository.get_user, self.user_id), 0)
+
+    def test_get_user_by_email(self):
+        """Test get user by email."""
+        self.assertEqual(repository.get_user_by_email(
+            'john@example.com').userId, self.user_id)
+        self.assertIsNone(repository.get_user_by_email('jane@example.com'))
+
+    def test_get_organisation(self):
+        """Test get organisation by primary key."""
+        self.assertEqual(repository.get_organisation(self.org_id).name,
+                         'John\'s Organisation')
+        self.assertIsNone(repository.get_organisation('missing'))
+
+    def test_is_member(self):
+        """Test membership checks."""
+        other = User(firstName='Jane', lastName='Smith',
+                     email='jane@example.com', password='password')
+        db.session.add(other)
+        db.session.commit()
+        self.assertTrue(repository.is_member(self.org_id, self.user_id))
+        self.assertFalse(repository.is_member(self.org_id, other.userId))
+        self.assertFalse(repository.is_member('missing', self.user_id))
+
+    def test_get_user_organisations(self):
+        """Test get user organisations."""
+        organisations = repository.get_user_organisations(self.user_id)
+        self.assertEqual([org.orgId for org in organisations], [self.org_id])
+
+    def test_get_user_organisations_single_statement(self):
+        """Test listing and serialising organisations is one statement."""
+        for i in range(3):
+            self.user.organisations.append(Organisation(name=f'Org {i}'))
+        db.session.commit()
+        db.session.expunge_all()
+
+        def list_organisations():
+            return [{"orgId": org.orgId, "name": org.name,
+                     "description": org.description}
+                    for org in repository.get_user_organisations(self.user_id)]
+        self.assertEqual(self.count_statements(list_organisations), 1)
+
+    def test_listed_organisation_loads_users(self):
+        """Test organisations from a listing can still load their users."""
+        repository.get_user_organisations(self.user_id)
+        org = repository.get_organisation(self.org_id)
+        self.assertEqual([user.userId for user in org.users], [self.user_id])
+
+    def test_add_member_is_idempotent(self):
+        """Test adding an existing member is a no-op."""
+        self.assertTrue(repository.is_member(self.org_id, self.user_id))
+        repository.add_member(self.org_id, self.user_id)
+        db.session.commit()
+        self.assertEqual(
+            len(repository.get_user_organisations(self.user_id)), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""test_slow_query."""
+import unittest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from flask_testing import TestCase
+from flask_jwt_extended import create_access_token
+from app import create_app, db
+from config import TestConfig
+from models import User, Organisation
+
+
+class SlowQueryConfig(TestConfig):
+    """Log every statement and EXPLAIN every SELECT."""
+    SLOW_QUERY_LOG = True
+    SLOW_QUERY_THRESHOLD_MS = 0
+    SLOW_QUERY_EXPLAIN_SAMPLE_RATE = 1.0
+
+
+class BaseTestCase(TestCase):
+    """Base test case."""
+
+    def create_app(self):
+        """Create app."""
+        app = create_app(SlowQueryConfig)
+        return app
+
+    def setUp(self):
+        """Set up integration test."""
+        db.create_all()
+        self.user = User(
+            firstName='John',
+            lastName='Doe',
+            email='john@example.com',
+            password='password',
+            phone='1234567890'
+        )
+        self.organisation = Organisation(name='John\'s Organisation')
+        self.user.organisations.append(self.organisation)
+        db.session.add(self.user)
+        db.session.commit()
+
+        self.headers = {
+            'Authorization': f'Bearer {create_access_token(identity=self.user.userId)}',
+            'X-Request-ID': 'test-request-id'
+        }
+
+    def tearDown(self):
+        """Tear down integration test."""
+        db.session.remove()
+        db.drop_all()
+
+
+class TestSlowQuery(BaseTestCase):
+    """Test slow-query log."""
+
+    def test_logs_endpoint_and_request_id(self):
+        """Test slow queries carry the endpoint and request ID."""
+        url = f'/api/organisations/{self.organisation.orgId}'
+        with self.assertLogs('slow_query', level='WARNING') as logs:
+            response = self.client.get(url, headers=self.headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['X-Request-ID'], 'test-request-id')
+        slow = [line for line in logs.output if 'slow query' in line]
+        self.assertTrue(slow)
+        self.assertIn('endpoint=organisation.get_organisation', slow[0])
+        self.assertIn('request_id=test-request-id', slow[0])
+
+    def test_explains_each_statement_once(self):
+        """Test EXPLAIN is captured once per unique statement."""
+        with self.assertLogs('slow_query', level='WARNING') as logs:
+            self.client.get('/api/organisations', headers=self.headers)
+            self.client.get('/api/organisations', headers=self.headers)
+        plans = [line for line in logs.output if 'query plan' in line]
+        self.assertTrue(plans)
+        self.assertEqual(len(plans), len(set(plans)))
+
+    def test_redacts_passwords(self):
+        """Test password parameters are redacted."""
+        with self.assertLogs('slow_query', level='WARNING') as logs:
+            self.client.post('/auth/register', json={
+                "firstName": "Jane",
+                "lastName": "Doe",
+                "email": "jane@example.com",
+                "password": "hunter2hunter2",
+            })
+        inserts = [line for line in logs.output if 'INSERT INTO users' in line]
+        self.assertTrue(inserts)
+        self.assertNotIn('pbkdf2', ''.join(logs.output))
+        self.assertIn("'password': '***'", inserts[0])
+
+    def test_statement_after_failure_is_logged(self):
+        """Test a failed statement does not disturb logging of the next one."""
+        with self.assertLogs('slow_query', level='WARNING') as logs:
+            with self.assertRaises(OperationalError):
+                db.session.execute(text('SELECT * FROM missing_table'))
+            db.session.rollback()
+            db.session.execute(text('SELECT 1'))
+        slow = [line for line in logs.output if 'slow query' in line]
+        self.assertEqual(len(slow), 1)
+        self.assertIn('statement=SELECT 1 ', slow[0])
+        self.assertNotIn('missing_table', slow[0])
+
+
+if __name__ == '__main__':
+    unittest.main()